@@ -0,0 +1,233 @@
+from collections import deque
+
+# Alberi di ricerca
+SOURCE_TREE = "S"
+SINK_TREE = "T"
+
+# Marcatore del predecessore per i nodi orfani
+ORPHAN = object()
+
+def boykov_kolmogorov(G, s, t):
+    """
+    Algoritmo di BOYKOV-KOLMOGOROV per il FLUSSO MASSIMO.
+
+    Pensato per grafi a griglia (segmentazione di immagini) con milioni di nodi
+    e cammini aumentanti corti. Ford-Fulkerson ripete ogni volta la ricerca
+    da zero; Boykov-Kolmogorov invece mantiene DUE ALBERI di ricerca fra
+    un aumento e l'altro:
+    - albero S, radicato in s: archi residui padre→figlio
+    - albero T, radicato in t: archi residui figlio→padre
+
+    Ogni iterazione ha tre fasi:
+    1. CRESCITA: i nodi attivi (sul bordo degli alberi) acquisiscono i vicini
+       liberi, finché un arco residuo collega l'albero S all'albero T
+    2. AUMENTO: si invia il delta lungo il cammino s → ... → t trovato.
+       Gli archi saturati staccano dei sottoalberi: le loro radici diventano ORFANI
+    3. ADOZIONE: ogni orfano cerca un nuovo padre nello stesso albero, con arco
+       residuo e collegato davvero alla radice (si preferisce il più vicino,
+       con marcature temporali per non ripetere le risalite). Se non lo trova
+       diventa libero e i suoi figli diventano a loro volta orfani
+    L'algoritmo termina quando non ci sono più nodi attivi.
+
+    CAPACITÀ RESIDUA:
+    r(i, j) = (u_ij - x_ij) + x_ji. Inviare d su i→j annulla prima il flusso x_ji.
+
+    Parametri:
+    - G: oggetto Graph con capacità e flussi
+    - s: nodo sorgente
+    - t: nodo pozzo
+
+    Ritorna:
+    - value: valore del flusso massimo
+    - iterations: lista di dizionari, uno per ogni aumento, contenente:
+        * path: cammino aumentante
+        * delta: quanto flusso è stato aggiunto
+      (senza copia del flusso: su grafi con milioni di nodi sarebbe troppo costosa)
+    - S: nodi dell'albero S alla fine (raggiungibili da s nel grafo residuo)
+    - T: tutti gli altri nodi
+    """
+    cap = G.cap
+    flow = G.flow
+
+    def res(i, j):
+        return cap[i][j] - flow[i][j] + flow[j][i]
+
+    def push(i, j, d):
+        # Prima annulla il flusso sull'arco opposto, poi usa l'arco diretto
+        back = min(d, flow[j][i])
+        flow[j][i] -= back
+        flow[i][j] += d - back
+
+    tree = {s: SOURCE_TREE, t: SINK_TREE}
+    parent = {s: None, t: None}
+    dist = {s: 0, t: 0}
+    stamp = {s: 0, t: 0}
+    time = 0
+
+    active = deque([s, t])
+    queued = {s, t}
+    head = None
+    orphans = deque()
+
+    def root_distance(q):
+        # Distanza di q dalla radice del suo albero, INF se la risalita incontra un orfano
+        d = 0
+        j = q
+        while True:
+            if stamp[j] == time:
+                d += dist[j]
+                break
+            pj = parent[j]
+            if pj is None:
+                break
+            if pj is ORPHAN:
+                return float("inf")
+            d += 1
+            j = pj
+
+        # Marca i nodi della risalita, così le prossime verifiche si fermano prima
+        total = d
+        j = q
+        while stamp[j] != time:
+            stamp[j] = time
+            dist[j] = d
+            d -= 1
+            if parent[j] is None:
+                break
+            j = parent[j]
+        return total
+
+    # Valore iniziale = flusso netto uscente da s
+    value = sum(flow[s].values()) - sum(flow[j][s] for j in cap[s])
+    iterations = []
+
+    while True:
+        # FASE 1: CRESCITA DEGLI ALBERI
+        # Il nodo in testa alla coda riprende la scansione dei vicini da dove
+        # si era fermato (head_pos): dopo un aumento non si riparte da capo
+        bridge = None
+        while active:
+            p = active[0]
+            tp = tree.get(p)
+            if tp is not None:
+                if p != head:
+                    head = p
+                    head_nbrs = list(cap[p])
+                    head_pos = 0
+                while head_pos < len(head_nbrs):
+                    q = head_nbrs[head_pos]
+                    tq = tree.get(q)
+                    if tq is not tp:
+                        r = res(p, q) if tp is SOURCE_TREE else res(q, p)
+                        if r > 0:
+                            if tq is None:
+                                tree[q] = tp
+                                parent[q] = p
+                                dist[q] = dist[p] + 1
+                                stamp[q] = stamp[p]
+                                if q not in queued:
+                                    active.append(q)
+                                    queued.add(q)
+                            else:
+                                bridge = (p, q) if tp is SOURCE_TREE else (q, p)
+                                break
+                    head_pos += 1
+                if bridge is not None:
+                    # p resta attivo: può avere altri archi verso l'albero opposto
+                    break
+            active.popleft()
+            queued.discard(p)
+            head = None
+
+        # CONDIZIONE DI TERMINAZIONE: gli alberi non si toccano più
+        if bridge is None:
+            break
+
+        # FASE 2: AUMENTO lungo s → ... → a → b → ... → t
+        a, b = bridge
+        d = res(a, b)
+        j = a
+        while parent[j] is not None:
+            d = min(d, res(parent[j], j))
+            j = parent[j]
+        j = b
+        while parent[j] is not None:
+            d = min(d, res(j, parent[j]))
+            j = parent[j]
+
+        time += 1
+        push(a, b, d)
+
+        path = [a]
+        j = a
+        while parent[j] is not None:
+            i = parent[j]
+            push(i, j, d)
+            if res(i, j) == 0:
+                parent[j] = ORPHAN
+                orphans.append(j)
+            path.append(i)
+            j = i
+        path.reverse()
+
+        j = b
+        path.append(b)
+        while parent[j] is not None:
+            i = parent[j]
+            push(j, i, d)
+            if res(j, i) == 0:
+                parent[j] = ORPHAN
+                orphans.append(j)
+            path.append(i)
+            j = i
+
+        value += d
+        iterations.append({
+            "path": path,
+            "delta": d,
+        })
+
+        # FASE 3: ADOZIONE DEGLI ORFANI
+        while orphans:
+            p = orphans.popleft()
+            tp = tree[p]
+
+            best = None
+            best_d = float("inf")
+            for q in cap[p]:
+                if tree.get(q) is not tp:
+                    continue
+                r = res(q, p) if tp is SOURCE_TREE else res(p, q)
+                if r <= 0:
+                    continue
+                dq = root_distance(q)
+                if dq < best_d:
+                    best = q
+                    best_d = dq
+
+            if best is not None:
+                parent[p] = best
+                stamp[p] = time
+                dist[p] = best_d + 1
+                continue
+
+            # Nessun padre valido: p diventa libero
+            for q in cap[p]:
+                if tree.get(q) is not tp:
+                    continue
+                r = res(q, p) if tp is SOURCE_TREE else res(p, q)
+                if r > 0:
+                    # Riattivato anche se già in coda: se q è in testa,
+                    # la sua scansione potrebbe aver già superato p
+                    active.append(q)
+                    queued.add(q)
+                if parent[q] == p:
+                    parent[q] = ORPHAN
+                    orphans.append(q)
+            tree[p] = None
+
+    # CALCOLO DEL TAGLIO MINIMO: nodi dell'albero S
+    S = {v for v, tv in tree.items() if tv is SOURCE_TREE}
+    T = set(G.cap.keys()) - S
+
+    return value, iterations, S, T
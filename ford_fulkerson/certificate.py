@@ -0,0 +1,101 @@
+from collections import defaultdict
+
+def verify_max_flow(G, s, t, value, S, T, tol=1e-9):
+    """
+    Verifica il CERTIFICATO DI OTTIMALITÀ restituito da un algoritmo di flusso massimo.
+
+    Gli algoritmi di Ford-Fulkerson restituiscono (value, iterations, S, T).
+    Per il teorema del taglio minimo - flusso massimo, il risultato è corretto
+    se e solo se:
+    1. Vincoli di capacità: 0 ≤ x_ij ≤ u_ij per ogni arco (i, j)
+    2. Conservazione del flusso: flusso entrante = flusso uscente
+       per ogni nodo diverso da s e t
+    3. (S, T) è una partizione dei nodi con s ∈ S e t ∈ T
+    4. Il flusso netto uscente da s è uguale a value
+    5. La capacità del taglio (S, T) è uguale a value
+
+    Tutti i controlli vengono svolti con UNA SOLA scansione degli archi,
+    quindi il costo è O(V + E).
+
+    Parametri:
+    - G: oggetto Graph con capacità e flussi (dopo l'esecuzione dell'algoritmo)
+    - s: nodo sorgente
+    - t: nodo pozzo
+    - value: valore del flusso restituito dall'algoritmo
+    - S, T: taglio restituito dall'algoritmo
+    - tol: tolleranza numerica per capacità non intere
+
+    Ritorna:
+    - report: dizionario con
+        * valid: True se non ci sono violazioni
+        * capacity: lista di (i, j, x_ij, u_ij) che violano i vincoli di capacità
+        * conservation: lista di (v, eccesso) per i nodi che non conservano il flusso
+        * partition: lista di messaggi sugli errori della partizione (S, T)
+        * flow_value: flusso netto uscente da s
+        * cut_capacity: capacità del taglio (S, T)
+        * value_mismatch: True se il flusso netto uscente da s è diverso da value
+        * cut_mismatch: True se la capacità del taglio è diversa da value
+    """
+    S = set(S)
+    T = set(T)
+
+    # CONTROLLO DELLA PARTIZIONE (S, T)
+    partition = []
+    if s not in S:
+        partition.append(f"la sorgente {s} non appartiene a S")
+    if t not in T:
+        partition.append(f"il pozzo {t} non appartiene a T")
+    common = S & T
+    if common:
+        partition.append(f"nodi sia in S che in T: {sorted(common, key=repr)}")
+    missing = G.nodes - S - T
+    if missing:
+        partition.append(f"nodi né in S né in T: {sorted(missing, key=repr)}")
+    unknown = (S | T) - G.nodes
+    if unknown:
+        partition.append(f"nodi non presenti nel grafo: {sorted(unknown, key=repr)}")
+
+    # SCANSIONE UNICA DEGLI ARCHI
+    # excess[v] = flusso entrante - flusso uscente
+    excess = defaultdict(int)
+    capacity = []
+    cut_capacity = 0
+
+    for i in G.cap:
+        for j in G.cap[i]:
+            u = G.cap[i][j]
+            x = G.flow[i][j]
+
+            # Vincolo di capacità
+            if x < -tol or x > u + tol:
+                capacity.append((i, j, x, u))
+
+            excess[i] -= x
+            excess[j] += x
+
+            # Arco che attraversa il taglio da S a T
+            if i in S and j in T:
+                cut_capacity += u
+
+    # CONTROLLO DELLA CONSERVAZIONE
+    conservation = [
+        (v, excess[v])
+        for v in G.nodes
+        if v != s and v != t and abs(excess[v]) > tol
+    ]
+
+    flow_value = -excess[s]
+    value_mismatch = abs(flow_value - value) > tol
+    cut_mismatch = abs(cut_capacity - value) > tol
+
+    return {
+        "valid": not (capacity or conservation or partition
+                      or value_mismatch or cut_mismatch),
+        "capacity": capacity,
+        "conservation": conservation,
+        "partition": partition,
+        "flow_value": flow_value,
+        "cut_capacity": cut_capacity,
+        "value_mismatch": value_mismatch,
+        "cut_mismatch": cut_mismatch,
+    }
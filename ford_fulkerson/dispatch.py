@@ -0,0 +1,44 @@
+from ford_fulkerson.labeling import ford_fulkerson_labeling
+from ford_fulkerson.hopcroft_karp import hopcroft_karp
+from ford_fulkerson.unit_capacity import unit_capacity_max_flow
+from ford_fulkerson.multi_terminal import ford_fulkerson_multi, is_terminal_collection
+
+def max_flow(G, s, t):
+    """
+    Calcola il flusso massimo scegliendo automaticamente l'algoritmo più adatto.
+
+    Riconosce la struttura del problema e sceglie:
+    1. Ford-Fulkerson con super-terminali virtuali, se s o t sono
+       insiemi/liste di nodi o dizionari {nodo: limite}.
+       Una tupla è un singolo nodo se appartiene a G (nodi a coordinate),
+       altrimenti è trattata come tupla di terminali
+    2. Hopcroft-Karp, se G è una rete bipartita a capacità unitarie
+       con super sorgente s e super pozzo t (problema di assegnamento)
+    3. Dinic su array di bit, se tutte le capacità valgono 0 oppure 1
+    4. Ford-Fulkerson con etichettamento, se i nodi sono interi positivi
+       (l'etichetta pred[j] = -i usa il segno per indicare l'arco inverso)
+    5. Ford-Fulkerson con BFS di ford_fulkerson_multi, per nodi di altro tipo
+       (ad esempio tuple (r, c) o stringhe)
+
+    Parametri:
+    - G: oggetto Graph con capacità e flussi
+    - s: nodo sorgente (oppure insieme/lista/dizionario di sorgenti)
+    - t: nodo pozzo (oppure insieme/lista/dizionario di pozzi)
+
+    Ritorna:
+    - value, iterations, S, T: come ford_fulkerson_labeling
+    """
+    if is_terminal_collection(G, s) or is_terminal_collection(G, t):
+        return ford_fulkerson_multi(G, s, t)
+
+    partition = G.unit_bipartite_partition(s, t)
+    if partition is not None:
+        return hopcroft_karp(G, s, t, partition)
+
+    if G.is_unit_capacity():
+        return unit_capacity_max_flow(G, s, t)
+
+    if all(isinstance(v, int) and v > 0 for v in G.cap):
+        return ford_fulkerson_labeling(G, s, t)
+
+    return ford_fulkerson_multi(G, {s}, {t})
@@ -0,0 +1,168 @@
+from collections import deque
+
+def hopcroft_karp(G, s, t, partition=None):
+    """
+    Algoritmo di HOPCROFT-KARP per reti bipartite a capacità unitarie.
+
+    Un problema di assegnamento viene modellato come una rete bipartita:
+    s→u (u ∈ L), u→v (u ∈ L, v ∈ R), v→t (v ∈ R), tutti con capacità 1.
+    Il flusso massimo corrisponde all'ABBINAMENTO (matching) massimo.
+
+    Ford-Fulkerson con etichettamento esegue un'intera fase di etichettamento
+    per ogni coppia abbinata. Hopcroft-Karp invece, in ogni FASE:
+    1. Una BFS dai nodi liberi di L calcola le distanze (grafo a livelli)
+       fino al primo livello che contiene un nodo libero di R
+    2. Una DFS trova un insieme massimale di cammini aumentanti minimi
+       disgiunti sui nodi, e li aumenta tutti insieme
+    Le fasi sono al più O(√V), quindi il costo totale è O(E√V).
+
+    TAGLIO MINIMO (costruzione di König):
+    Alla fine, S contiene s, i nodi di L raggiungibili con cammini alternanti
+    dai nodi liberi di L e i nodi di R adiacenti ad essi. Sono esattamente
+    i nodi raggiungibili da s nel grafo residuo.
+
+    Parametri:
+    - G: oggetto Graph con capacità e flussi
+    - s: super sorgente
+    - t: super pozzo
+    - partition: coppia (L, R) già calcolata con G.unit_bipartite_partition
+                 (opzionale, se assente viene calcolata qui)
+
+    Ritorna:
+    - value: valore del flusso massimo (cardinalità dell'abbinamento)
+    - iterations: lista di dizionari, uno per ogni cammino aumentante, contenente:
+        * path: cammino aumentante (da s a t nel grafo residuo)
+        * delta: flusso aggiunto (sempre 1)
+        * flow: stato del flusso dopo la fase, SOLO nell'ultimo cammino
+          di ogni fase (una copia per cammino costerebbe O(E) ciascuna
+          e annullerebbe il vantaggio O(E√V))
+    - S, T: taglio minimo
+    """
+    if partition is None:
+        partition = G.unit_bipartite_partition(s, t)
+        if partition is None:
+            raise ValueError("il grafo non è una rete bipartita a capacità unitarie")
+    L, R = partition
+
+    INF = float("inf")
+
+    # Lista di adiacenza L→R (solo archi con capacità positiva)
+    adj = {u: [v for v in G.cap[u] if G.cap[u][v] > 0] for u in L}
+
+    # Abbinamento iniziale letto dal flusso corrente
+    match_l = {}
+    match_r = {}
+    for u in L:
+        for v in adj[u]:
+            if G.flow[u][v] > 0:
+                match_l[u] = v
+                match_r[v] = u
+
+    value = len(match_l)
+    iterations = []
+
+    while True:
+        # FASE BFS: distanze dai nodi liberi di L
+        dist = {u: INF for u in L}
+        queue = deque()
+        for u in L:
+            if u not in match_l:
+                dist[u] = 0
+                queue.append(u)
+
+        # Lunghezza del cammino aumentante minimo (livello del primo nodo libero di R)
+        dist_free = INF
+        while queue:
+            u = queue.popleft()
+            if dist[u] >= dist_free:
+                continue
+            for v in adj[u]:
+                w = match_r.get(v)
+                if w is None:
+                    if dist_free == INF:
+                        dist_free = dist[u] + 1
+                elif dist[w] == INF:
+                    dist[w] = dist[u] + 1
+                    queue.append(w)
+
+        # CONDIZIONE DI TERMINAZIONE:
+        # nessun nodo libero di R è raggiungibile → abbinamento massimo
+        if dist_free == INF:
+            break
+
+        # FASE DFS: cammini aumentanti minimi disgiunti sui nodi
+        # pos[u] = indice del prossimo arco da esplorare (arco corrente)
+        pos = {u: 0 for u in L}
+        found = 0
+
+        for root in L:
+            if root in match_l:
+                continue
+
+            # stack = nodi di L del cammino, chosen = nodi di R scelti
+            stack = [root]
+            chosen = []
+            while stack:
+                u = stack[-1]
+                if pos[u] == len(adj[u]):
+                    # Vicolo cieco: u non serve più in questa fase
+                    dist[u] = INF
+                    stack.pop()
+                    if chosen:
+                        chosen.pop()
+                    continue
+
+                v = adj[u][pos[u]]
+                pos[u] += 1
+                w = match_r.get(v)
+
+                if w is None:
+                    if dist[u] + 1 != dist_free:
+                        continue
+                    chosen.append(v)
+
+                    # AUMENTO lungo il cammino alternante:
+                    # s→u0→v0←u1→v1←...→vk→t
+                    path = [s]
+                    G.flow[s][root] = 1
+                    for k, (uu, vv) in enumerate(zip(stack, chosen)):
+                        if k > 0:
+                            # arco inverso: uu lascia il vecchio abbinamento chosen[k-1]
+                            G.flow[uu][chosen[k - 1]] = 0
+                        G.flow[uu][vv] = 1
+                        match_l[uu] = vv
+                        match_r[vv] = uu
+                        path.append(uu)
+                        path.append(vv)
+                    G.flow[v][t] = 1
+                    path.append(t)
+
+                    found += 1
+
+                    # Salva i dettagli di questo cammino
+                    iterations.append({
+                        "path": path,
+                        "delta": 1,
+                    })
+                    break
+
+                if dist[w] == dist[u] + 1:
+                    chosen.append(v)
+                    stack.append(w)
+
+        value += found
+
+        # Copia del flusso (per visualizzazione), una sola volta per fase
+        if found:
+            iterations[-1]["flow"] = {i: dict(G.flow[i]) for i in G.flow}
+
+    # CALCOLO DEL TAGLIO MINIMO (König)
+    # L'ultima BFS ha raggiunto tutti i nodi di L alternanti dai nodi liberi
+    S = {s}
+    for u in L:
+        if dist[u] < INF:
+            S.add(u)
+            S.update(adj[u])
+    T = set(G.cap.keys()) - S
+
+    return value, iterations, S, T
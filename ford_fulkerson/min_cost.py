@@ -0,0 +1,181 @@
+import heapq
+from itertools import count
+
+def residual_arcs(G, i):
+    """
+    Genera gli archi uscenti dal nodo i nel grafo residuo, con il loro costo.
+
+    Per ogni vicino j (G contiene sempre sia (i,j) che (j,i)):
+    1. ARCO DIRETTO i→j con capacità residua u_ij - x_ij e costo c_ij
+    2. ARCO INVERSO i→j con capacità residua x_ji e costo -c_ji
+       (annullare flusso sull'arco (j,i) restituisce il suo costo)
+
+    Parametri:
+    - G: oggetto Graph con capacità, costi e flussi
+    - i: nodo di partenza
+
+    Ritorna (generatore):
+    - tuple (j, residuo, costo, diretto) con diretto=True per l'arco diretto
+    """
+    for j in G.cap[i]:
+        r = G.cap[i][j] - G.flow[i][j]
+        if r > 0:
+            yield j, r, G.cost[i][j], True
+        if G.flow[j][i] > 0:
+            yield j, G.flow[j][i], -G.cost[j][i], False
+
+
+def initial_potentials(G, s):
+    """
+    Calcola i potenziali iniziali di Johnson con Bellman-Ford sul grafo residuo.
+
+    Viene eseguito UNA SOLA VOLTA, e solo se il grafo residuo contiene archi
+    di costo negativo: con costi tutti non negativi i potenziali nulli vanno già bene.
+
+    Parametri:
+    - G: oggetto Graph con capacità, costi e flussi
+    - s: nodo sorgente
+
+    Ritorna:
+    - pi: dizionario dei potenziali (distanze minime da s, 0 se irraggiungibile)
+    """
+    dist = {s: 0}
+    for _ in range(len(G.cap)):
+        changed = False
+        for i in list(dist):
+            for j, r, c, forward in residual_arcs(G, i):
+                if dist[i] + c < dist.get(j, float("inf")):
+                    dist[j] = dist[i] + c
+                    changed = True
+        if not changed:
+            break
+    else:
+        raise ValueError("il grafo residuo contiene un ciclo di costo negativo")
+
+    return {v: dist.get(v, 0) for v in G.cap}
+
+
+def min_cost_max_flow(G, s, t):
+    """
+    Algoritmo dei CAMMINI MINIMI SUCCESSIVI per il FLUSSO MASSIMO DI COSTO MINIMO.
+
+    Come Ford-Fulkerson, aumenta il flusso lungo cammini nel grafo residuo,
+    ma ogni volta sceglie il cammino aumentante di COSTO MINIMO.
+    Il flusso finale è massimo e, fra i flussi massimi, ha costo minimo.
+
+    POTENZIALI DI JOHNSON:
+    Il grafo residuo contiene archi di costo negativo (gli archi inversi),
+    quindi Dijkstra non si può usare direttamente. Con i potenziali pi
+    si usano i COSTI RIDOTTI:
+        c'_ij = c_ij + pi[i] - pi[j] ≥ 0
+    Dopo ogni Dijkstra i potenziali vengono aggiornati con le distanze
+    trovate, e i costi ridotti restano non negativi anche sui nuovi archi inversi.
+    Così ogni aumento costa O(E log V) (Dijkstra con heap binario)
+    invece di un passo di Bellman-Ford O(VE).
+
+    Parametri:
+    - G: oggetto Graph con capacità, costi e flussi
+    - s: nodo sorgente
+    - t: nodo pozzo
+
+    Ritorna:
+    - value: valore del flusso massimo
+    - total_cost: costo totale del flusso Σ c_ij x_ij
+    - iterations: lista di dizionari, uno per ogni iterazione, contenente:
+        * path: cammino aumentante di costo minimo
+        * delta: quanto flusso è stato aggiunto
+        * cost: costo unitario del cammino
+        * flow: stato del flusso dopo questa iterazione
+    - S, T: taglio minimo
+    """
+    INF = float("inf")
+
+    # Potenziali iniziali: Bellman-Ford solo se servono
+    negative = any(
+        c < 0
+        for i in G.cap
+        for j, r, c, forward in residual_arcs(G, i)
+    )
+    pi = initial_potentials(G, s) if negative else {v: 0 for v in G.cap}
+
+    # Valore iniziale = flusso netto uscente da s
+    value = sum(G.flow[s].values()) - sum(G.flow[j][s] for j in G.cap[s])
+
+    iterations = []
+    tie = count()
+
+    while True:
+        # DIJKSTRA con heap binario sui costi ridotti
+        # pred[j] = (i, diretto): j raggiunto da i con arco diretto o inverso
+        dist = {s: 0}
+        pred = {}
+        heap = [(0, next(tie), s)]
+        while heap:
+            d, _, i = heapq.heappop(heap)
+            if d > dist[i]:
+                continue
+            for j, r, c, forward in residual_arcs(G, i):
+                nd = d + c + pi[i] - pi[j]
+                if nd < dist.get(j, INF):
+                    dist[j] = nd
+                    pred[j] = (i, forward)
+                    heapq.heappush(heap, (nd, next(tie), j))
+
+        # CONDIZIONE DI TERMINAZIONE: t non raggiungibile
+        if t not in dist:
+            break
+
+        # AGGIORNAMENTO DEI POTENZIALI
+        # I nodi non raggiunti ricevono la distanza massima, così i costi
+        # ridotti degli archi che li collegano restano non negativi
+        far = max(dist.values())
+        for v in pi:
+            pi[v] += dist.get(v, far)
+
+        # RICOSTRUZIONE DEL CAMMINO e calcolo del delta
+        path = [t]
+        delta = INF
+        j = t
+        while j != s:
+            i, forward = pred[j]
+            r = G.cap[i][j] - G.flow[i][j] if forward else G.flow[j][i]
+            delta = min(delta, r)
+            path.append(i)
+            j = i
+        path.reverse()
+
+        # AGGIORNAMENTO DEI FLUSSI e costo del cammino
+        path_cost = 0
+        j = t
+        while j != s:
+            i, forward = pred[j]
+            if forward:
+                G.flow[i][j] += delta
+                path_cost += G.cost[i][j]
+            else:
+                G.flow[j][i] -= delta
+                path_cost -= G.cost[j][i]
+            j = i
+
+        value += delta
+
+        # Salva i dettagli di questa iterazione
+        iterations.append({
+            "path": path,
+            "delta": delta,
+            "cost": path_cost,
+            # Copia del flusso corrente (per visualizzazione)
+            "flow": {i: dict(G.flow[i]) for i in G.flow}
+        })
+
+    total_cost = sum(
+        G.flow[i][j] * G.cost[i][j]
+        for i in G.cap
+        for j in G.cap[i]
+    )
+
+    # CALCOLO DEL TAGLIO MINIMO: nodi raggiunti dall'ultima Dijkstra
+    S = set(dist)
+    T = set(G.cap.keys()) - S
+
+    return value, total_cost, iterations, S, T
@@ -0,0 +1,164 @@
+from collections import deque
+
+def is_terminal_collection(G, terminals):
+    """
+    Stabilisce se terminals è un INSIEME di terminali o un singolo nodo.
+
+    Insiemi, liste e dizionari sono sempre collezioni di terminali.
+    Una tupla è una collezione solo se NON è un nodo del grafo: i grafi
+    con nodi a tupla (ad esempio coordinate (r, c)) restano corretti.
+
+    Parametri:
+    - G: oggetto Graph
+    - terminals: nodo oppure collezione di nodi
+
+    Ritorna:
+    - True se terminals va trattato come collezione di terminali
+    """
+    if isinstance(terminals, (set, frozenset, list, dict)):
+        return True
+    return isinstance(terminals, tuple) and terminals not in G.cap
+
+
+def terminal_limits(G, terminals):
+    """
+    Normalizza un insieme di terminali nel formato {nodo: limite}.
+
+    Parametri:
+    - G: oggetto Graph (per distinguere un nodo a tupla da una tupla di nodi)
+    - terminals: un nodo, un insieme/lista/tupla di nodi (limite illimitato),
+                 oppure un dizionario {nodo: limite} (None = illimitato).
+                 Una tupla che è un nodo di G viene trattata come singolo nodo.
+
+    Ritorna:
+    - dizionario {nodo: limite}, con float("inf") per i terminali illimitati
+    """
+    if isinstance(terminals, dict):
+        items = terminals.items()
+    elif is_terminal_collection(G, terminals):
+        items = ((v, None) for v in terminals)
+    else:
+        items = [(terminals, None)]
+
+    return {v: float("inf") if limit is None else limit for v, limit in items}
+
+
+def ford_fulkerson_multi(G, sources, sinks):
+    """
+    Ford-Fulkerson con PIÙ SORGENTI e PIÙ POZZI, tramite super-terminali VIRTUALI.
+
+    Il modo classico è aggiungere al grafo una super sorgente σ con archi σ→s_k
+    e un super pozzo τ con archi t_k→τ. Qui questi archi NON vengono inseriti
+    in G.cap/G.flow: vengono risolti direttamente dentro la ricerca.
+    - La BFS parte contemporaneamente da tutte le sorgenti con offerta residua
+      (equivale a partire da σ)
+    - Un cammino termina appena raggiunge un pozzo con domanda residua
+      (equivale a raggiungere τ)
+    - Il flusso sugli archi virtuali è tenuto in due dizionari locali
+      (sent e received)
+    Così lo stesso Graph può essere usato con molti insiemi di terminali
+    diversi senza essere copiato o ricostruito (vedi Graph.reset_flow).
+
+    Parametri:
+    - G: oggetto Graph con capacità e flussi
+    - sources: sorgenti (nodo, insieme/lista di nodi, o dizionario {nodo: offerta})
+    - sinks: pozzi (nodo, insieme/lista di nodi, o dizionario {nodo: domanda})
+      Un limite None indica un terminale illimitato. Una tupla che è un nodo
+      di G è un singolo terminale (vedi is_terminal_collection).
+
+    Ritorna:
+    - value: valore del flusso massimo dalle sorgenti ai pozzi
+    - iterations: lista di dizionari, uno per ogni iterazione, contenente:
+        * path: cammino aumentante (da una sorgente a un pozzo)
+        * delta: quanto flusso è stato aggiunto
+        * flow: stato del flusso dopo questa iterazione
+    - S: nodi raggiungibili dalla super sorgente virtuale nel grafo residuo
+    - T: tutti gli altri nodi
+    """
+    supply = terminal_limits(G, sources)
+    demand = terminal_limits(G, sinks)
+
+    for v in supply.keys() & demand.keys():
+        if supply[v] == float("inf") and demand[v] == float("inf"):
+            raise ValueError(f"il nodo {v} è sorgente e pozzo illimitato")
+
+    # Flusso sugli archi virtuali σ→s_k e t_k→τ
+    sent = {v: 0 for v in supply}
+    received = {v: 0 for v in demand}
+
+    value = 0
+    iterations = []
+
+    while True:
+        # pred[j] = (i, diretto): j raggiunto da i con arco diretto o inverso
+        # pred[j] = None se j è una sorgente (raggiunta dall'arco virtuale σ→j)
+        pred = {}
+        delta = {}
+        queue = deque()
+
+        for v in supply:
+            if supply[v] - sent[v] > 0:
+                pred[v] = None
+                delta[v] = supply[v] - sent[v]
+                queue.append(v)
+
+        # BFS fino al primo pozzo con domanda residua (arco virtuale j→τ)
+        end = None
+        while queue:
+            i = queue.popleft()
+            if i in demand and demand[i] - received[i] > 0:
+                end = i
+                break
+
+            # .get: un terminale assente dal grafo non deve essere aggiunto a G.cap
+            for j in G.cap.get(i, {}):
+                if j in pred:
+                    continue
+                r = G.cap[i][j] - G.flow[i][j]
+                if r > 0:
+                    pred[j] = (i, True)
+                    delta[j] = min(delta[i], r)
+                    queue.append(j)
+                elif G.flow[j][i] > 0:
+                    pred[j] = (i, False)
+                    delta[j] = min(delta[i], G.flow[j][i])
+                    queue.append(j)
+
+        # CONDIZIONE DI TERMINAZIONE: nessun pozzo raggiungibile
+        if end is None:
+            break
+
+        d = min(delta[end], demand[end] - received[end])
+
+        # RICOSTRUZIONE DEL CAMMINO E AGGIORNAMENTO DEI FLUSSI
+        path = [end]
+        j = end
+        while pred[j] is not None:
+            i, forward = pred[j]
+            if forward:
+                G.flow[i][j] += d
+            else:
+                G.flow[j][i] -= d
+            path.append(i)
+            j = i
+        path.reverse()
+
+        # Aggiorna gli archi virtuali
+        sent[j] += d
+        received[end] += d
+        value += d
+
+        # Salva i dettagli di questa iterazione
+        iterations.append({
+            "path": path,
+            "delta": d,
+            # Copia del flusso corrente (per visualizzazione)
+            "flow": {i: dict(G.flow[i]) for i in G.flow}
+        })
+
+    # CALCOLO DEL TAGLIO MINIMO: nodi etichettati dall'ultima BFS
+    # (esclusi i terminali che non appartengono al grafo)
+    S = {v for v in pred if v in G.cap}
+    T = set(G.cap.keys()) - S
+
+    return value, iterations, S, T
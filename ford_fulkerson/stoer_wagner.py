@@ -0,0 +1,102 @@
+import heapq
+from collections import defaultdict
+from itertools import count
+
+def global_min_cut(G):
+    """
+    Calcola il TAGLIO MINIMO GLOBALE del grafo con l'algoritmo di STOER-WAGNER.
+
+    Il taglio minimo globale è il taglio (S, T) di capacità minima fra TUTTI
+    i tagli possibili, senza fissare sorgente e pozzo: indica il punto più
+    debole dell'intera rete. Invece di eseguire Ford-Fulkerson V - 1 volte
+    (una per ogni possibile pozzo), Stoer-Wagner non calcola nessun flusso.
+
+    VISTA NON ORIENTATA:
+    Il peso dello spigolo {i, j} è w_ij = u_ij + u_ji.
+
+    ALGORITMO:
+    Ripete V - 1 FASI. In ogni fase:
+    1. Ordina i nodi per MASSIMA ADIACENZA: parte da un nodo qualsiasi e
+       aggiunge ogni volta il nodo più connesso a quelli già aggiunti
+       (con un heap binario, aggiornamenti pigri)
+    2. Siano prev e last gli ultimi due nodi aggiunti: il "taglio della fase"
+       separa last da tutti gli altri e vale la sua connessione finale.
+       È un taglio minimo fra prev e last
+    3. Fonde last in prev (contrazione)
+    Il taglio minimo globale è il minimo fra i tagli delle fasi.
+    Con heap binario il costo è O(V E log V).
+
+    Parametri:
+    - G: oggetto Graph con capacità
+
+    Ritorna:
+    - value: capacità del taglio minimo globale
+    - S: insieme di nodi da un lato del taglio
+    - T: insieme di nodi dall'altro lato del taglio
+    """
+    # COSTRUZIONE DELLA VISTA NON ORIENTATA
+    W = defaultdict(dict)
+    for i in G.cap:
+        for j, u in G.cap[i].items():
+            if i != j and u > 0:
+                W[i][j] = W[i].get(j, 0) + u
+                W[j][i] = W[j].get(i, 0) + u
+
+    remaining = list(G.cap.keys())
+    if len(remaining) < 2:
+        return 0, set(remaining), set()
+
+    # members[v] = nodi originali fusi nel super-nodo v
+    members = {v: [v] for v in remaining}
+
+    best_value = float("inf")
+    best_side = None
+    tie = count()
+
+    while len(remaining) > 1:
+        # ORDINAMENTO PER MASSIMA ADIACENZA
+        key = {v: 0 for v in remaining}
+        added = set()
+        heap = [(0, next(tie), remaining[0])]
+        scan = 0
+        prev = last = None
+
+        while len(added) < len(remaining):
+            v = None
+            while heap:
+                w, _, u = heapq.heappop(heap)
+                if u not in added and -w == key[u]:
+                    v = u
+                    break
+            if v is None:
+                # Grafo non connesso: si riparte da un nodo non ancora aggiunto
+                while remaining[scan] in added:
+                    scan += 1
+                v = remaining[scan]
+
+            added.add(v)
+            prev, last = last, v
+
+            for u, w in W[v].items():
+                if u not in added:
+                    key[u] += w
+                    heapq.heappush(heap, (-key[u], next(tie), u))
+
+        # TAGLIO DELLA FASE: last separato da tutti gli altri
+        if key[last] < best_value:
+            best_value = key[last]
+            best_side = list(members[last])
+
+        # CONTRAZIONE: last viene fuso in prev
+        for u, w in W[last].items():
+            if u != prev:
+                W[prev][u] = W[prev].get(u, 0) + w
+                W[u][prev] = W[u].get(prev, 0) + w
+            del W[u][last]
+        del W[last]
+        members[prev].extend(members.pop(last))
+        remaining.remove(last)
+
+    S = set(best_side)
+    T = set(G.cap.keys()) - S
+    return best_value, S, T
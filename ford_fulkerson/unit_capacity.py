@@ -0,0 +1,153 @@
+from collections import deque
+
+def unit_capacity_max_flow(G, s, t):
+    """
+    Flusso massimo specializzato per reti a CAPACITÀ UNITARIE (u_ij ∈ {0, 1}).
+
+    Su queste reti (cammini disgiunti sugli archi, connettività) ogni arco
+    è pieno oppure vuoto, quindi:
+    - lo stato del flusso è UN BIT per arco, memorizzato in un array di bit
+      compatto (bytearray, 8 archi per byte) invece che in dizionari
+    - ogni cammino aumentante porta esattamente 1 unità di flusso,
+      quindi non serve calcolare minimi né etichette delta
+
+    ARCHI RESIDUI:
+    Ogni arco a = (i, j) genera due "semi-archi":
+    - 2a     (diretto i→j): residuo se il bit di a vale 0
+    - 2a + 1 (inverso j→i): residuo se il bit di a vale 1
+    Inviare flusso su un semi-arco significa invertire il bit di a.
+
+    ALGORITMO (Dinic, analisi di Even-Tarjan):
+    Ogni FASE costruisce con una BFS il grafo a livelli e poi trova con una DFS
+    (con puntatore all'arco corrente) un flusso bloccante. Su reti unitarie
+    le fasi sono O(min(V^(2/3), E^(1/2))) e ogni fase costa O(E), per un
+    totale di O(min(V^(2/3), E^(1/2)) · E).
+
+    Parametri:
+    - G: oggetto Graph con capacità 0/1 e flussi
+    - s: nodo sorgente
+    - t: nodo pozzo
+
+    Ritorna:
+    - value: valore del flusso massimo
+    - iterations: lista di dizionari, uno per ogni cammino aumentante, contenente:
+        * path: cammino aumentante
+        * delta: flusso aggiunto (sempre 1)
+        * flow: stato del flusso dopo la fase, SOLO nell'ultimo cammino
+          di ogni fase (una copia per cammino costerebbe O(E) ciascuna
+          e supererebbe il limite di Even-Tarjan)
+    - S, T: taglio minimo
+    """
+    # NUMERAZIONE DEI NODI
+    nodes = list(G.cap.keys())
+    index = {v: k for k, v in enumerate(nodes)}
+    n = len(nodes)
+
+    # NUMERAZIONE DEGLI ARCHI con capacità 1
+    tail = []
+    head = []
+    for i in G.cap:
+        for j, u in G.cap[i].items():
+            if u == 1:
+                tail.append(index[i])
+                head.append(index[j])
+    m = len(tail)
+
+    # Array di bit del flusso, inizializzato con il flusso corrente
+    bits = bytearray((m + 7) // 8)
+    for a in range(m):
+        if G.flow[nodes[tail[a]]][nodes[head[a]]]:
+            bits[a >> 3] |= 1 << (a & 7)
+
+    # Liste di adiacenza dei semi-archi
+    adj = [[] for _ in range(n)]
+    for a in range(m):
+        adj[tail[a]].append(2 * a)
+        adj[head[a]].append(2 * a + 1)
+
+    src = index[s]
+    dst = index[t]
+
+    # Valore iniziale = flusso netto uscente da s
+    value = 0
+    for h in adj[src]:
+        a = h >> 1
+        if (bits[a >> 3] >> (a & 7)) & 1:
+            value += -1 if h & 1 else 1
+
+    iterations = []
+
+    while True:
+        # FASE BFS: grafo a livelli sugli archi residui
+        level = [-1] * n
+        level[src] = 0
+        queue = deque([src])
+        while queue:
+            i = queue.popleft()
+            for h in adj[i]:
+                a = h >> 1
+                # il semi-arco è residuo se il bit di a è diverso dalla sua direzione
+                if ((bits[a >> 3] >> (a & 7)) & 1) != (h & 1):
+                    continue
+                j = tail[a] if h & 1 else head[a]
+                if level[j] < 0:
+                    level[j] = level[i] + 1
+                    queue.append(j)
+
+        # CONDIZIONE DI TERMINAZIONE: t non raggiungibile
+        if level[dst] < 0:
+            break
+
+        # FASE DFS: flusso bloccante con puntatore all'arco corrente
+        pos = [0] * n
+        found = 0
+        while True:
+            stack = [src]
+            used = []
+            while stack and stack[-1] != dst:
+                i = stack[-1]
+                if pos[i] == len(adj[i]):
+                    # Vicolo cieco: i esce dal grafo a livelli
+                    level[i] = -1
+                    stack.pop()
+                    if used:
+                        used.pop()
+                    continue
+                h = adj[i][pos[i]]
+                pos[i] += 1
+                a = h >> 1
+                if ((bits[a >> 3] >> (a & 7)) & 1) != (h & 1):
+                    continue
+                j = tail[a] if h & 1 else head[a]
+                if level[j] == level[i] + 1:
+                    used.append(h)
+                    stack.append(j)
+
+            if not stack:
+                break
+
+            # AUMENTO di 1 unità: inverte il bit di ogni arco del cammino
+            # e riporta il nuovo valore nei dizionari di G
+            for h in used:
+                a = h >> 1
+                bits[a >> 3] ^= 1 << (a & 7)
+                G.flow[nodes[tail[a]]][nodes[head[a]]] = (bits[a >> 3] >> (a & 7)) & 1
+            found += 1
+
+            # Salva i dettagli di questo cammino
+            iterations.append({
+                "path": [nodes[k] for k in stack],
+                "delta": 1,
+            })
+
+        value += found
+
+        # Copia del flusso (per visualizzazione), una sola volta per fase
+        if found:
+            iterations[-1]["flow"] = {i: dict(G.flow[i]) for i in G.flow}
+
+    # CALCOLO DEL TAGLIO MINIMO: nodi raggiunti dall'ultima BFS
+    S = {nodes[k] for k in range(n) if level[k] >= 0}
+    T = set(G.cap.keys()) - S
+
+    return value, iterations, S, T
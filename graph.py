@@ -2,7 +2,7 @@ from collections import defaultdict
 
 class Graph:
     """
-    Grafo diretto con capacità e flussi.
+    Grafo diretto con capacità, costi e flussi.
     Rispetta l'assunzione:
     se (i,j) ∈ A allora anche (j,i) ∈ A (con capacità eventualmente nulla)
     """
@@ -10,9 +10,10 @@ class Graph:
     def __init__(self):
         self.cap = defaultdict(dict)   # capacità u_ij
         self.flow = defaultdict(dict)  # flusso x_ij
+        self.cost = defaultdict(dict)  # costo unitario c_ij
         self.nodes = set()
 
-    def add_edge(self, i, j, capacity):
+    def add_edge(self, i, j, capacity, cost=0):
         """
         Aggiunge un arco diretto dal nodo i al nodo j con una data capacità.
 
@@ -20,21 +21,162 @@ class Graph:
         - i: nodo sorgente dell'arco
         - j: nodo destinazione dell'arco
         - capacity: capacità massima dell'arco (u_ij)
+        - cost: costo unitario del flusso sull'arco (c_ij, default 0)
 
         Questa funzione:
-        1. Crea l'arco diretto (i,j) con la capacità specificata
+        1. Crea l'arco diretto (i,j) con la capacità e il costo specificati
         2. Inizializza il flusso a 0 (nessun flusso all'inizio)
         3. Crea automaticamente l'arco inverso (j,i) se non esiste,
-           con capacità 0 (necessario per l'algoritmo di Ford-Fulkerson)
+           con capacità 0 e costo -c_ij (necessario per l'algoritmo di
+           Ford-Fulkerson e per il flusso di costo minimo)
         4. Aggiunge i nodi i e j al set dei nodi del grafo
         """
         self.cap[i][j] = capacity
         self.flow[i][j] = 0
+        self.cost[i][j] = cost
 
         # arco inverso
         if i not in self.cap[j]:
             self.cap[j][i] = 0
             self.flow[j][i] = 0
+            self.cost[j][i] = -cost
 
         self.nodes.add(i)
         self.nodes.add(j)
+
+    def unit_bipartite_partition(self, s, t):
+        """
+        Riconosce se il grafo è una rete bipartita a capacità unitarie
+        con super sorgente s e super pozzo t (problema di assegnamento).
+
+        La struttura riconosciuta è:
+        - archi s→u con capacità 1 per ogni u ∈ L
+        - archi u→v con capacità 1 con u ∈ L e v ∈ R
+        - archi v→t con capacità 1 per ogni v ∈ R
+        Gli archi con capacità 0 (archi inversi) vengono ignorati.
+
+        Parametri:
+        - s: super sorgente
+        - t: super pozzo
+
+        Ritorna:
+        - (L, R): i due lati della bipartizione, se il grafo ha questa struttura
+        - None altrimenti
+        """
+        L = {j for j, u in self.cap.get(s, {}).items() if u > 0}
+        R = {i for i in self.cap if self.cap[i].get(t, 0) > 0}
+
+        if t in L or s in R or L & R:
+            return None
+
+        for i in self.cap:
+            for j, u in self.cap[i].items():
+                if u == 0:
+                    continue
+                if u != 1:
+                    return None
+                # Ogni arco con capacità positiva deve essere s→L, L→R oppure R→t
+                if not ((i == s and j in L)
+                        or (i in L and j in R)
+                        or (i in R and j == t)):
+                    return None
+
+        return L, R
+
+    def is_unit_capacity(self):
+        """
+        Verifica se tutte le capacità del grafo valgono 0 oppure 1.
+
+        È il caso dei problemi di cammini disgiunti sugli archi e di connettività,
+        per cui esiste un algoritmo specializzato (vedi unit_capacity.py).
+
+        Ritorna:
+        - True se ogni u_ij ∈ {0, 1}, False altrimenti
+        """
+        return all(u == 0 or u == 1 for i in self.cap for u in self.cap[i].values())
+
+    def reset_flow(self):
+        """
+        Riporta a 0 il flusso su tutti gli archi, lasciando invariate capacità e costi.
+
+        Permette di riutilizzare lo stesso grafo per più problemi di flusso
+        (ad esempio con insiemi di sorgenti e pozzi diversi) senza ricostruirlo.
+        """
+        for i in self.flow:
+            for j in self.flow[i]:
+                self.flow[i][j] = 0
+
+
+def grid_graph(pairwise, source, sink, connectivity=4):
+    """
+    Costruisce in blocco un grafo a griglia, tipico della segmentazione di immagini.
+
+    Ogni cella (r, c) della griglia è un nodo (pixel), numerato r * cols + c + 1.
+    Gli archi sono:
+    - p→q verso ogni vicino q (4 o 8 vicini) con capacità pairwise[r][c]
+    - s→p con capacità source[r][c] (solo se positiva)
+    - p→t con capacità sink[r][c] (solo se positiva)
+
+    I dizionari cap, flow e cost vengono riempiti direttamente, riga per riga,
+    invece di chiamare add_edge per ogni arco. L'assunzione di Graph è rispettata:
+    gli archi fra vicini esistono in entrambe le direzioni, e gli archi inversi
+    dei terminali (p→s e t→p) sono creati con capacità 0.
+
+    Parametri:
+    - pairwise: matrice (lista di liste) delle capacità verso i vicini
+    - source: matrice delle capacità s→p
+    - sink: matrice delle capacità p→t
+    - connectivity: 4 oppure 8 (vicinato del pixel)
+
+    Ritorna:
+    - G: oggetto Graph della griglia
+    - s: nodo sorgente (rows * cols + 1)
+    - t: nodo pozzo (rows * cols + 2)
+    """
+    if connectivity == 4:
+        offsets = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+    elif connectivity == 8:
+        offsets = [(0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+    else:
+        raise ValueError("connectivity deve valere 4 oppure 8")
+
+    rows = len(pairwise)
+    cols = len(pairwise[0]) if rows else 0
+    s = rows * cols + 1
+    t = rows * cols + 2
+
+    G = Graph()
+    cap_s = G.cap[s]
+    cap_t = G.cap[t]
+
+    for r in range(rows):
+        for c in range(cols):
+            p = r * cols + c + 1
+            w = pairwise[r][c]
+
+            # Archi verso i vicini interni alla griglia
+            caps = {
+                (r + dr) * cols + (c + dc) + 1: w
+                for dr, dc in offsets
+                if 0 <= r + dr < rows and 0 <= c + dc < cols
+            }
+
+            # Archi dei terminali e relativi archi inversi
+            if source[r][c] > 0:
+                cap_s[p] = source[r][c]
+                caps[s] = 0
+            if sink[r][c] > 0:
+                caps[t] = sink[r][c]
+                cap_t[p] = 0
+
+            G.cap[p] = caps
+            G.flow[p] = dict.fromkeys(caps, 0)
+            G.cost[p] = dict.fromkeys(caps, 0)
+
+    G.flow[s] = dict.fromkeys(cap_s, 0)
+    G.cost[s] = dict.fromkeys(cap_s, 0)
+    G.flow[t] = dict.fromkeys(cap_t, 0)
+    G.cost[t] = dict.fromkeys(cap_t, 0)
+    G.nodes = set(G.cap.keys())
+
+    return G, s, t